@@ -25,72 +25,64 @@ Phone: 0401234567
 Email: anna.virtanen@example.com
 """
 
-from datetime import datetime
+import sys
+from datetime import date, time
 
 
-def print_reservation_number(reservation: list) -> None:
-    """Prints the reservation number."""
-    number = int(reservation[0])
-    print(f"Reservation number: {number}")
+def format_reservation_number(number: int) -> str:
+    """Returns the reservation number line."""
+    return f"Reservation number: {number}"
 
 
-def print_booker(reservation: list) -> None:
-    """Prints the name of the person who made the reservation."""
-    booker = reservation[1]
-    print(f"Booker: {booker}")
+def format_booker(booker: str) -> str:
+    """Returns the name of the person who made the reservation."""
+    return f"Booker: {booker}"
 
 
-def print_date(reservation: list) -> None:
-    """Prints the reservation date in DD.MM.YYYY format."""
-    date = datetime.strptime(reservation[2], "%Y-%m-%d").date()
-    print(f"Date: {date.strftime('%d.%m.%Y')}")
+def format_date(day: date) -> str:
+    """Returns the reservation date in DD.MM.YYYY format."""
+    return f"Date: {day.strftime('%d.%m.%Y')}"
 
 
-def print_start_time(reservation: list) -> None:
-    """Prints the start time in HH.MM format."""
-    time = datetime.strptime(reservation[3], "%H:%M").time()
-    print(f"Start time: {time.strftime('%H.%M')}")
+def format_start_time(start: time) -> str:
+    """Returns the start time in HH.MM format."""
+    return f"Start time: {start.strftime('%H.%M')}"
 
 
-def print_hours(reservation: list) -> None:
-    """Prints the number of reserved hours."""
-    hours = int(reservation[4])
-    print(f"Number of hours: {hours}")
+def format_hours(hours: int) -> str:
+    """Returns the number of reserved hours."""
+    return f"Number of hours: {hours}"
 
 
-def print_hourly_rate(reservation: list) -> None:
-    """Prints the hourly rate in European format."""
-    rate = float(reservation[5])
-    print(f"Hourly rate: {str(f'{rate:.2f}').replace('.', ',')} €")
+def format_hourly_rate(rate: float) -> str:
+    """Returns the hourly rate in European format."""
+    return f"Hourly rate: {str(f'{rate:.2f}').replace('.', ',')} €"
 
 
-def print_total_price(reservation: list) -> None:
-    """Calculates and prints the total price."""
-    hours = int(reservation[4])
-    rate = float(reservation[5])
+def format_total_price(hours: int, rate: float) -> str:
+    """Calculates and returns the total price."""
     total = hours * rate
-    print(f"Total price: {str(f'{total:.2f}').replace('.', ',')} €")
+    return f"Total price: {str(f'{total:.2f}').replace('.', ',')} €"
 
 
-def print_paid(reservation: list) -> None:
-    """Prints whether the reservation is paid."""
-    paid = reservation[6].strip().lower() == "true"
-    print(f"Paid: {'Yes' if paid else 'No'}")
+def format_paid(paid: bool) -> str:
+    """Returns whether the reservation is paid."""
+    return f"Paid: {'Yes' if paid else 'No'}"
 
 
-def print_venue(reservation: list) -> None:
-    """Prints the reserved venue."""
-    print(f"Venue: {reservation[7]}")
+def format_venue(venue: str) -> str:
+    """Returns the reserved venue."""
+    return f"Venue: {venue}"
 
 
-def print_phone(reservation: list) -> None:
-    """Prints the phone number."""
-    print(f"Phone: {reservation[8]}")
+def format_phone(phone: str) -> str:
+    """Returns the phone number."""
+    return f"Phone: {phone}"
 
 
-def print_email(reservation: list) -> None:
-    """Prints the email address."""
-    print(f"Email: {reservation[9]}")
+def format_email(email: str) -> str:
+    """Returns the email address."""
+    return f"Email: {email}"
 
 
 def main():
@@ -100,17 +92,29 @@ def main():
     with open(reservations, "r", encoding="utf-8") as f:
         reservation = f.read().strip().split('|')
 
-    print_reservation_number(reservation)
-    print_booker(reservation)
-    print_date(reservation)
-    print_start_time(reservation)
-    print_hours(reservation)
-    print_hourly_rate(reservation)
-    print_total_price(reservation)
-    print_paid(reservation)
-    print_venue(reservation)
-    print_phone(reservation)
-    print_email(reservation)
+    # Convert each field once and pass the values to the helpers
+    number = int(reservation[0])
+    day = date.fromisoformat(reservation[2])
+    start = time.fromisoformat(reservation[3])
+    hours = int(reservation[4])
+    rate = float(reservation[5])
+    paid = reservation[6].strip().lower() == "true"
+
+    # Build every line first and print them with a single write
+    lines = [
+        format_reservation_number(number),
+        format_booker(reservation[1]),
+        format_date(day),
+        format_start_time(start),
+        format_hours(hours),
+        format_hourly_rate(rate),
+        format_total_price(hours, rate),
+        format_paid(paid),
+        format_venue(reservation[7]),
+        format_phone(reservation[8]),
+        format_email(reservation[9]),
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
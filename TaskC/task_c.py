@@ -12,8 +12,8 @@
 A program that prints reservation information according to task requirements.
 """
 
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, time
+from typing import List, NamedTuple
 
 # Column headers (used only in Part A printing)
 HEADERS = [
@@ -31,7 +31,22 @@ HEADERS = [
 ]
 
 
-def convert_reservation_data(reservation: list) -> list:
+class Reservation(NamedTuple):
+    """One converted reservation row; fields follow the HEADERS order"""
+    reservationId: int
+    name: str
+    email: str
+    phone: str
+    reservationDate: date
+    reservationTime: time
+    durationHours: int
+    price: float
+    confirmed: bool
+    reservedResource: str
+    createdAt: datetime
+
+
+def convert_reservation_data(reservation: list) -> Reservation:
     """
     Convert data types to meet program requirements
 
@@ -39,49 +54,25 @@ def convert_reservation_data(reservation: list) -> list:
      reservation (list): Unconverted reservation -> 11 columns
 
     Returns:
-     converted (list): Converted data types
+     Reservation: Converted data types
     """
-    converted: list = []
-
-
-    # 1) reservationId (str -> int)
-    converted.append(int(reservation[0]))
-
-    # 2) name (str)
-    converted.append(reservation[1])
-
-    # 3) email (str)
-    converted.append(reservation[2])
-
-    # 4) phone (str)
-    converted.append(reservation[3])
-
-    # 5) reservationDate (str -> date)
-    converted.append(datetime.strptime(reservation[4], "%Y-%m-%d").date())
+    return Reservation(
+        int(reservation[0]),                                # 1) reservationId (str -> int)
+        reservation[1],                                     # 2) name (str)
+        reservation[2],                                     # 3) email (str)
+        reservation[3],                                     # 4) phone (str)
+        date.fromisoformat(reservation[4]),                 # 5) reservationDate (str -> date)
+        time.fromisoformat(reservation[5]),                 # 6) reservationTime (str -> time)
+        int(reservation[6]),                                # 7) durationHours (str -> int)
+        float(reservation[7]),                              # 8) price (str -> float)
+        reservation[8] == "True",                           # 9) confirmed (str -> bool)
+        reservation[9],                                     # 10) reservedResource (str)
+        datetime.fromisoformat(reservation[10].strip()),    # 11) createdAt (str -> datetime)
+    )
 
-    # 6) reservationTime (str -> time)
-    converted.append(datetime.strptime(reservation[5], "%H:%M").time())
 
-    # 7) durationHours (str -> int)
-    converted.append(int(reservation[6]))
 
-    # 8) price (str -> float)
-    converted.append(float(reservation[7]))
-
-    # 9) confirmed (str -> bool)
-    converted.append(reservation[8] == "True")
-
-    # 10) reservedResource (str)
-    converted.append(reservation[9])
-
-    # 11) createdAt (str -> datetime)
-    converted.append(datetime.strptime(reservation[10].strip(), "%Y-%m-%d %H:%M:%S"))
-
-    return converted
-
-
-
-def fetch_reservations(reservation_file: str) -> list:
+def fetch_reservations(reservation_file: str) -> List[Reservation]:
     """
     Reads reservations from a file and converts each row.
     """
@@ -95,70 +86,63 @@ def fetch_reservations(reservation_file: str) -> list:
 
 # ---------------------- PART B FUNCTIONS ---------------------- #
 
-def confirmed_reservations(reservations: List[List]) -> None:
+def print_part_b(reservations: List[Reservation]) -> None:
     """
-    Prints all confirmed reservations in required format.
+    Prints all Part B sections using a single pass over the reservations:
+    confirmed reservations, long reservations (>= 3 h), confirmation
+    statuses, confirmation summary and total revenue.
     """
-    print("1) Confirmed Reservations")
-    for r in reservations:
-        if r[8]:  # confirmed == True
-            date_str = r[4].strftime("%d.%m.%Y")
-            time_str = r[5].strftime("%H.%M")
-            print(f"- {r[1]}, {r[9]}, {date_str} at {time_str}")
-    print()
+    confirmed_lines = []
+    long_lines = []
+    status_lines = []
+    confirmed_count = 0
+    total = 0.0
 
-
-def long_reservations(reservations: List[List]) -> None:
-    """
-    Prints reservations with duration >= 3 hours.
-    """
-    print("2) Long Reservations (≥ 3 h)")
     for r in reservations:
-        if r[6] >= 3:
-            date_str = r[4].strftime("%d.%m.%Y")
-            time_str = r[5].strftime("%H.%M")
-            print(f"- {r[1]}, {date_str} at {time_str}, duration {r[6]} h, {r[9]}")
-    print()
+        status = "Confirmed" if r.confirmed else "NOT Confirmed"
+        status_lines.append(f"- {r.name} → {status}")
 
+        is_long = r.durationHours >= 3
+        if not (r.confirmed or is_long):
+            # Neither section prints this row, so skip formatting its date and time
+            continue
 
-def confirmation_statuses(reservations: List[List]) -> None:
-    """
-    Prints each reservation's confirmation status.
-    """
-    print("3) Reservation Confirmation Status")
-    for r in reservations:
-        status = "Confirmed" if r[8] else "NOT Confirmed"
-        print(f"- {r[1]} → {status}")
-    print()
+        date_str = r.reservationDate.strftime("%d.%m.%Y")
+        time_str = r.reservationTime.strftime("%H.%M")
 
+        if r.confirmed:
+            confirmed_lines.append(f"- {r.name}, {r.reservedResource}, {date_str} at {time_str}")
+            confirmed_count += 1
+            # Sum price only for confirmed reservations
+            total += r.price
 
-def confirmation_summary(reservations: List[List]) -> None:
-    """
-    Prints summary of confirmed vs not confirmed reservations.
-    """
-    print("4) Confirmation Summary")
-    confirmed_count = sum(1 for r in reservations if r[8])
-    not_confirmed_count = len(reservations) - confirmed_count
-
-    print(f"- Confirmed reservations: {confirmed_count} pcs")
-    print(f"- Not confirmed reservations: {not_confirmed_count} pcs")
-    print()
+        if is_long:
+            long_lines.append(f"- {r.name}, {date_str} at {time_str}, duration {r.durationHours} h, {r.reservedResource}")
 
-
-def total_revenue(reservations: List[List]) -> None:
-    """
-    Calculates and prints total revenue from confirmed reservations.
-    """
-    print("5) Total Revenue from Confirmed Reservations")
-
-    # Sum price only for confirmed reservations
-    total = sum(r[7] for r in reservations if r[8])
+    not_confirmed_count = len(reservations) - confirmed_count
 
     # Format with comma instead of dot
     amount_str = f"{total:.2f}".replace(".", ",")
 
-    print(f"Total revenue from confirmed reservations: {amount_str} €")
-    print()
+    # Each section ends with an empty line
+    print("\n".join([
+        "1) Confirmed Reservations",
+        *confirmed_lines,
+        "",
+        "2) Long Reservations (≥ 3 h)",
+        *long_lines,
+        "",
+        "3) Reservation Confirmation Status",
+        *status_lines,
+        "",
+        "4) Confirmation Summary",
+        f"- Confirmed reservations: {confirmed_count} pcs",
+        f"- Not confirmed reservations: {not_confirmed_count} pcs",
+        "",
+        "5) Total Revenue from Confirmed Reservations",
+        f"Total revenue from confirmed reservations: {amount_str} €",
+        "",
+    ]))
 
 
 # ---------------------- MAIN PROGRAM ---------------------- #
@@ -170,11 +154,7 @@ def main():
     reservations = fetch_reservations("reservations.txt")
 
     # PART B – Required final output
-    confirmed_reservations(reservations)
-    long_reservations(reservations)
-    confirmation_statuses(reservations)
-    confirmation_summary(reservations)
-    total_revenue(reservations)
+    print_part_b(reservations)
 
 
 if __name__ == "__main__":
@@ -9,91 +9,115 @@
 # Modified by Rex Odomero Oghenerobo according to given task D
 
 from __future__ import annotations
-import csv
-from datetime import datetime, date
-from typing import Dict, List
+import mmap
+from array import array
+from datetime import date, datetime
+from typing import Dict, List, Set, Tuple
 
 
-FINNISH_WEEKDAYS = {
-    0: "maanantai",
-    1: "tiistai",
-    2: "keskiviikko",
-    3: "torstai",
-    4: "perjantai",
-    5: "lauantai",
-    6: "sunnuntai",
-}
+# Indexed by date.weekday() (0 = Monday)
+FINNISH_WEEKDAYS = (
+    "maanantai",
+    "tiistai",
+    "keskiviikko",
+    "torstai",
+    "perjantai",
+    "lauantai",
+    "sunnuntai",
+)
 
 
-def read_data(filename: str) -> List[Dict]:
+def read_data(filename: str) -> Tuple[List[date], List[array]]:
     """
-    Reads the CSV file and returns a list of dictionaries.
-    Each dictionary contains:
-        - date (datetime.date)
-        - consumption phases v1, v2, v3 (Wh)
-        - production phases v1, v2, v3 (Wh)
+    Reads the CSV file and returns the data column by column.
+    Returns a tuple (dates, columns):
+        - dates: one datetime.date per hourly row
+        - columns: six integer arrays (Wh), consumption phases v1, v2, v3
+          followed by production phases v1, v2, v3
     """
-    rows = []
-
-    with open(filename, encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter=";")
-        next(reader)  # skip header
-
-        for line in reader:
-            timestamp_str = line[0]
-            dt = datetime.fromisoformat(timestamp_str)
-            d = dt.date()
-
-            # Convert strings to integers (Wh)
-            cons1 = int(line[1])
-            cons2 = int(line[2])
-            cons3 = int(line[3])
-            prod1 = int(line[4])
-            prod2 = int(line[5])
-            prod3 = int(line[6])
-
-            rows.append({
-                "date": d,
-                "cons": [cons1, cons2, cons3],
-                "prod": [prod1, prod2, prod3],
-            })
-
-    return rows
-
-
-def compute_daily_totals(rows: List[Dict]) -> Dict[date, Dict[str, List[float]]]:
+    dates: List[date] = []
+    columns = [array("l") for _ in range(6)]
+    # Each day prefix and time suffix is parsed only once
+    parsed_days: Dict[bytes, date] = {}
+    valid_times: Set[bytes] = set()
+
+    # Parse raw bytes; int() accepts them directly
+    with open(filename, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Sequential read-ahead hint
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        mm.readline()  # skip header
+
+        for line in iter(mm.readline, b""):
+            fields = line.split(b";")
+            if len(fields) < 7:
+                continue
+
+            timestamp = fields[0]
+            day_bytes = timestamp[:10]
+            d = parsed_days.get(day_bytes)
+            if d is None:
+                d = parsed_days[day_bytes] = date.fromisoformat(day_bytes.decode())
+            if timestamp[10:] not in valid_times:
+                # Full check once per new suffix
+                datetime.fromisoformat(timestamp.decode())
+                valid_times.add(timestamp[10:])
+            dates.append(d)
+
+            # Convert fields to integers (Wh)
+            for column, value in zip(columns, fields[1:7]):
+                column.append(int(value))
+
+    return dates, columns
+
+
+def compute_daily_totals(
+    dates: List[date], columns: List[array]
+) -> Dict[date, Dict[str, List[int]]]:
     """
     Groups hourly rows by date and sums consumption and production.
-    Returns a dictionary:
-        { date: { "cons": [kWh1, kWh2, kWh3], "prod": [kWh1, kWh2, kWh3] } }
+    Returns a dictionary with exact integer totals:
+        { date: { "cons": [Wh1, Wh2, Wh3], "prod": [Wh1, Wh2, Wh3] } }
     """
-    daily: Dict[date, Dict[str, List[float]]] = {}
+    daily: Dict[date, Dict[str, List[int]]] = {}
+
+    # Each day is a run of consecutive rows
+    starts = [
+        row for row in range(len(dates))
+        if row == 0 or dates[row] != dates[row - 1]
+    ]
+    ends = starts[1:] + [len(dates)]
 
-    for row in rows:
-        d = row["date"]
+    for start, end in zip(starts, ends):
+        d = dates[start]
 
         if d not in daily:
             daily[d] = {
-                "cons": [0.0, 0.0, 0.0],
-                "prod": [0.0, 0.0, 0.0],
+                "cons": [0, 0, 0],
+                "prod": [0, 0, 0],
             }
 
-        # Add Wh → convert to kWh
+        # Sum Wh (converted to kWh only when formatted)
         for i in range(3):
-            daily[d]["cons"][i] += row["cons"][i] / 1000
-            daily[d]["prod"][i] += row["prod"][i] / 1000
+            daily[d]["cons"][i] += sum(columns[i][start:end])
+            daily[d]["prod"][i] += sum(columns[i + 3][start:end])
 
     return daily
 
 
-def format_kwh(value: float) -> str:
+def format_kwh(value_wh: int) -> str:
     """
-    Formats a kWh value with two decimals and a comma as decimal separator.
+    Formats a Wh total as kWh with two decimals and a comma as decimal separator.
+    Halves are rounded away from zero (36255 Wh -> 36,26).
     """
-    return f"{value:.2f}".replace(".", ",")
+    hundredths = (abs(value_wh) + 5) // 10
+    sign = "-" if value_wh < 0 and hundredths else ""
+    return f"{sign}{hundredths // 100},{hundredths % 100:02d}"
 
 
-def print_report(daily: Dict[date, Dict[str, List[float]]]) -> None:
+def print_report(daily: Dict[date, Dict[str, List[int]]]) -> None:
     """
     Prints the weekly electricity report in a clean table format.
     """
@@ -104,7 +128,7 @@ def print_report(daily: Dict[date, Dict[str, List[float]]]) -> None:
 
     for d in sorted(daily.keys()):
         weekday = FINNISH_WEEKDAYS[d.weekday()]
-        date_str = d.strftime("%d.%m.%Y")
+        date_str = f"{d.day:02d}.{d.month:02d}.{d.year}"
 
         cons = daily[d]["cons"]
         prod = daily[d]["prod"]
@@ -124,8 +148,8 @@ def main() -> None:
     Main function: reads data, computes daily totals, and prints the report.
     """
     filename = "week42.csv"
-    rows = read_data(filename)
-    daily_totals = compute_daily_totals(rows)
+    dates, columns = read_data(filename)
+    daily_totals = compute_daily_totals(dates, columns)
     print_report(daily_totals)
 
 
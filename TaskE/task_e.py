@@ -16,59 +16,101 @@ calculates daily summaries, and writes a formatted report to a text file.
 All values are converted from Wh to kWh using Finnish formatting conventions.
 """
 
-from datetime import datetime, date
-from typing import List, Dict, Tuple
+import mmap
+import os
+from array import array
+from datetime import date, datetime
+from typing import List, Dict, Set, Tuple
 
 
-def read_data(filename: str) -> List:
+# Measurement columns in CSV order (values in Wh)
+COLUMNS = ('cons_p1', 'cons_p2', 'cons_p3', 'prod_p1', 'prod_p2', 'prod_p3')
+
+# Weekday names indexed by date.weekday() (0 = Monday)
+FINNISH_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Static report lines, built once at import time
+DOUBLE_RULE = "=" * 85 + "\n"
+SINGLE_RULE = "-" * 85 + "\n"
+WEEK_TABLE_HEADER = (
+    SINGLE_RULE
+    + "Day        Date            Consumption [kWh]            Production [kWh]\n"
+    + "                           v1       v2       v3           v1       v2       v3\n"
+    + SINGLE_RULE
+)
+
+
+def read_data(filename: str) -> Tuple[List[date], List[array]]:
     """
-    Reads a CSV file and returns the rows as a list of dictionaries.
+    Reads a CSV file and returns the rows column by column.
     
     Args:
         filename: Path to the CSV file to read
         
     Returns:
-        A list of dictionaries, where each dictionary represents one row with keys:
-        'timestamp', 'cons_p1', 'cons_p2', 'cons_p3', 'prod_p1', 'prod_p2', 'prod_p3'
+        A tuple (dates, columns), where dates holds one date per row and columns
+        holds one array of values per key in COLUMNS, in the same row order.
+        Rows that cannot be parsed are skipped.
     """
-    data = []
-    try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-            
-        # Skip header line
-        for line in lines[1:]:
-            line = line.strip()
-            if line:
-                parts = line.split(';')
-                if len(parts) == 7:
-                    data.append({
-                        'timestamp': parts[0],
-                        'cons_p1': float(parts[1]),
-                        'cons_p2': float(parts[2]),
-                        'cons_p3': float(parts[3]),
-                        'prod_p1': float(parts[4]),
-                        'prod_p2': float(parts[5]),
-                        'prod_p3': float(parts[6])
-                    })
-    except FileNotFoundError:
+    dates: List[date] = []
+    columns = [array('d') for _ in COLUMNS]
+    # Each day prefix and time suffix is parsed only once
+    parsed_days: Dict[bytes, date] = {}
+    valid_times: Set[bytes] = set()
+    if not os.path.isfile(filename):
         print(f"Error: File '{filename}' not found.")
-        return []
-    except ValueError as e:
-        print(f"Error parsing file '{filename}': {e}")
-        return []
+        return [], []
+    if os.path.getsize(filename) == 0:
+        # An empty file has no rows and cannot be memory-mapped
+        return [], []
     
-    return data
+    # Parse raw bytes; float() accepts them directly
+    with open(filename, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Sequential read-ahead hint
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        
+        # Skip header line
+        mm.readline()
+        
+        for line in iter(mm.readline, b''):
+            parts = line.strip().split(b';')
+            if len(parts) != 7:
+                continue
+            
+            # A malformed row is skipped without discarding the rows already read
+            try:
+                values = [float(value) for value in parts[1:]]
+                timestamp = parts[0]
+                day_bytes = timestamp[:10]
+                day = parsed_days.get(day_bytes)
+                if day is None:
+                    day = parsed_days[day_bytes] = date.fromisoformat(day_bytes.decode())
+                if timestamp[10:] not in valid_times:
+                    # Full check once per new suffix
+                    datetime.fromisoformat(timestamp.decode())
+                    valid_times.add(timestamp[10:])
+            except ValueError as e:
+                print(f"Skipping malformed row in '{filename}': {e}")
+                continue
+            
+            dates.append(day)
+            for column, value in zip(columns, values):
+                column.append(value)
+    
+    return dates, columns
 
 
-def calculate_daily_summaries(data: List) -> Dict:
+def calculate_daily_summaries(dates: List[date], columns: List[array]) -> Dict:
     """
     Calculates daily summaries for consumption and production by phase.
     
     Groups hourly data by date and sums up consumption and production for each phase.
     
     Args:
-        data: List of dictionaries containing hourly measurement data
+        dates: Date of each hourly measurement
+        columns: Hourly measurement values, one array per key in COLUMNS
         
     Returns:
         A dictionary with dates as keys and daily summaries as values,
@@ -76,27 +118,20 @@ def calculate_daily_summaries(data: List) -> Dict:
     """
     daily_summaries = {}
     
-    for record in data:
-        dt = datetime.fromisoformat(record['timestamp'])
-        day = dt.date()
+    # Each day is a run of consecutive rows
+    starts = [row for row in range(len(dates)) if row == 0 or dates[row] != dates[row - 1]]
+    ends = starts[1:] + [len(dates)]
+    
+    for start, end in zip(starts, ends):
+        day = dates[start]
         
         if day not in daily_summaries:
-            daily_summaries[day] = {
-                'cons_p1': 0.0,
-                'cons_p2': 0.0,
-                'cons_p3': 0.0,
-                'prod_p1': 0.0,
-                'prod_p2': 0.0,
-                'prod_p3': 0.0
-            }
+            daily_summaries[day] = dict.fromkeys(COLUMNS, 0.0)
         
-        # Add hourly values to daily totals
-        daily_summaries[day]['cons_p1'] += record['cons_p1']
-        daily_summaries[day]['cons_p2'] += record['cons_p2']
-        daily_summaries[day]['cons_p3'] += record['cons_p3']
-        daily_summaries[day]['prod_p1'] += record['prod_p1']
-        daily_summaries[day]['prod_p2'] += record['prod_p2']
-        daily_summaries[day]['prod_p3'] += record['prod_p3']
+        # Add the day's hourly values to daily totals
+        summary = daily_summaries[day]
+        for key, column in zip(COLUMNS, columns):
+            summary[key] += sum(column[start:end])
     
     return daily_summaries
 
@@ -111,10 +146,7 @@ def convert_wh_to_kwh_and_format(value_wh: float) -> str:
     Returns:
         Formatted string with comma as decimal separator and two decimal places
     """
-    value_kwh = value_wh / 1000.0
-    value_str = f"{value_kwh:.2f}"
-    value_str = value_str.replace(".", ",")
-    return value_str
+    return f"{value_wh / 1000.0:.2f}".replace(".", ",")
 
 
 def get_finnish_weekday(day: date) -> str:
@@ -127,16 +159,7 @@ def get_finnish_weekday(day: date) -> str:
     Returns:
         The Finnish name of the weekday (Monday, Tuesday, etc.)
     """
-    finnish_weekdays = {
-        0: "Monday",
-        1: "Tuesday",
-        2: "Wednesday",
-        3: "Thursday",
-        4: "Friday",
-        5: "Saturday",
-        6: "Sunday"
-    }
-    return finnish_weekdays[day.weekday()]
+    return FINNISH_WEEKDAYS[day.weekday()]
 
 
 def format_date(day: date) -> str:
@@ -166,13 +189,10 @@ def format_report_row(day: date, summary: Dict) -> str:
     weekday = get_finnish_weekday(day)
     date_str = format_date(day)
     
-    cons_p1 = convert_wh_to_kwh_and_format(summary['cons_p1'])
-    cons_p2 = convert_wh_to_kwh_and_format(summary['cons_p2'])
-    cons_p3 = convert_wh_to_kwh_and_format(summary['cons_p3'])
-    
-    prod_p1 = convert_wh_to_kwh_and_format(summary['prod_p1'])
-    prod_p2 = convert_wh_to_kwh_and_format(summary['prod_p2'])
-    prod_p3 = convert_wh_to_kwh_and_format(summary['prod_p3'])
+    # Same conversion as convert_wh_to_kwh_and_format, inlined for all six columns
+    cons_p1, cons_p2, cons_p3, prod_p1, prod_p2, prod_p3 = [
+        f"{summary[key] / 1000.0:.2f}".replace(".", ",") for key in COLUMNS
+    ]
     
     row = f"{weekday:<11}{date_str:<15}{cons_p1:>8}  {cons_p2:>8}  {cons_p3:>8}      {prod_p1:>8}  {prod_p2:>8}  {prod_p3:>8}"
     
@@ -190,63 +210,75 @@ def write_report(filename: str, weekly_data: Dict) -> None:
         filename: Path to the output report file
         weekly_data: Dictionary with week numbers as keys and daily summaries as values
     """
-    with open(filename, 'w', encoding='utf-8') as file:
-        file.write("=" * 85 + "\n")
-        file.write("ELECTRICITY CONSUMPTION AND PRODUCTION REPORT - WEEKS 41, 42, 43\n")
-        file.write("=" * 85 + "\n\n")
-        
-        for week_num in sorted(weekly_data.keys()):
-            daily_summaries = weekly_data[week_num]
-            
-            # Write week heading
-            file.write(f"Week {week_num} electricity consumption and production (kWh, by phase)\n")
-            file.write("-" * 85 + "\n")
-            file.write("Day        Date            Consumption [kWh]            Production [kWh]\n")
-            file.write("                           v1       v2       v3           v1       v2       v3\n")
-            file.write("-" * 85 + "\n")
-            
-            # Write daily rows
-            sorted_days = sorted(daily_summaries.keys())
-            for day in sorted_days:
-                summary = daily_summaries[day]
-                row = format_report_row(day, summary)
-                file.write(row + "\n")
-            
-            file.write("-" * 85 + "\n\n")
-        
-        # Optional: Add total summary for all weeks
-        file.write("=" * 85 + "\n")
-        file.write("TOTAL SUMMARY - ALL WEEKS (41, 42, 43)\n")
-        file.write("=" * 85 + "\n\n")
-        
-        total_cons_p1 = 0.0
-        total_cons_p2 = 0.0
-        total_cons_p3 = 0.0
-        total_prod_p1 = 0.0
-        total_prod_p2 = 0.0
-        total_prod_p3 = 0.0
+    parts = []
+    parts.append(DOUBLE_RULE)
+    parts.append("ELECTRICITY CONSUMPTION AND PRODUCTION REPORT - WEEKS 41, 42, 43\n")
+    parts.append(DOUBLE_RULE + "\n")
+    
+    # Totals for all weeks are accumulated while the daily rows are written
+    totals = dict.fromkeys(COLUMNS, 0.0)
+    
+    for week_num in sorted(weekly_data.keys()):
+        daily_summaries = weekly_data[week_num]
         
-        for week_num in sorted(weekly_data.keys()):
-            for day, summary in weekly_data[week_num].items():
-                total_cons_p1 += summary['cons_p1']
-                total_cons_p2 += summary['cons_p2']
-                total_cons_p3 += summary['cons_p3']
-                total_prod_p1 += summary['prod_p1']
-                total_prod_p2 += summary['prod_p2']
-                total_prod_p3 += summary['prod_p3']
+        # Write week heading
+        parts.append(f"Week {week_num} electricity consumption and production (kWh, by phase)\n")
+        parts.append(WEEK_TABLE_HEADER)
         
-        total_cons = total_cons_p1 + total_cons_p2 + total_cons_p3
-        total_prod = total_prod_p1 + total_prod_p2 + total_prod_p3
+        # Write daily rows
+        sorted_days = sorted(daily_summaries.keys())
+        for day in sorted_days:
+            summary = daily_summaries[day]
+            row = format_report_row(day, summary)
+            parts.append(row + "\n")
+            for key in COLUMNS:
+                totals[key] += summary[key]
         
-        file.write(f"Total Consumption (all phases): {convert_wh_to_kwh_and_format(total_cons)} kWh\n")
-        file.write(f"  - Phase 1: {convert_wh_to_kwh_and_format(total_cons_p1)} kWh\n")
-        file.write(f"  - Phase 2: {convert_wh_to_kwh_and_format(total_cons_p2)} kWh\n")
-        file.write(f"  - Phase 3: {convert_wh_to_kwh_and_format(total_cons_p3)} kWh\n\n")
+        parts.append(SINGLE_RULE + "\n")
+    
+    # Optional: Add total summary for all weeks
+    parts.append(DOUBLE_RULE)
+    parts.append("TOTAL SUMMARY - ALL WEEKS (41, 42, 43)\n")
+    parts.append(DOUBLE_RULE + "\n")
+    
+    total_cons_p1 = totals['cons_p1']
+    total_cons_p2 = totals['cons_p2']
+    total_cons_p3 = totals['cons_p3']
+    total_prod_p1 = totals['prod_p1']
+    total_prod_p2 = totals['prod_p2']
+    total_prod_p3 = totals['prod_p3']
+    
+    total_cons = total_cons_p1 + total_cons_p2 + total_cons_p3
+    total_prod = total_prod_p1 + total_prod_p2 + total_prod_p3
+    
+    parts.append(f"Total Consumption (all phases): {convert_wh_to_kwh_and_format(total_cons)} kWh\n")
+    parts.append(f"  - Phase 1: {convert_wh_to_kwh_and_format(total_cons_p1)} kWh\n")
+    parts.append(f"  - Phase 2: {convert_wh_to_kwh_and_format(total_cons_p2)} kWh\n")
+    parts.append(f"  - Phase 3: {convert_wh_to_kwh_and_format(total_cons_p3)} kWh\n\n")
+    
+    parts.append(f"Total Production (all phases): {convert_wh_to_kwh_and_format(total_prod)} kWh\n")
+    parts.append(f"  - Phase 1: {convert_wh_to_kwh_and_format(total_prod_p1)} kWh\n")
+    parts.append(f"  - Phase 2: {convert_wh_to_kwh_and_format(total_prod_p2)} kWh\n")
+    parts.append(f"  - Phase 3: {convert_wh_to_kwh_and_format(total_prod_p3)} kWh\n")
+    
+    # Write the whole report at once
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write(''.join(parts))
+
+
+def process_week(filename: str) -> Dict:
+    """
+    Reads one weekly CSV file and calculates its daily summaries.
+    
+    Args:
+        filename: Path to the weekly CSV file
         
-        file.write(f"Total Production (all phases): {convert_wh_to_kwh_and_format(total_prod)} kWh\n")
-        file.write(f"  - Phase 1: {convert_wh_to_kwh_and_format(total_prod_p1)} kWh\n")
-        file.write(f"  - Phase 2: {convert_wh_to_kwh_and_format(total_prod_p2)} kWh\n")
-        file.write(f"  - Phase 3: {convert_wh_to_kwh_and_format(total_prod_p3)} kWh\n")
+    Returns:
+        Daily summaries as returned by calculate_daily_summaries,
+        or an empty dictionary if the file could not be read
+    """
+    dates, columns = read_data(filename)
+    return calculate_daily_summaries(dates, columns)
 
 
 def main() -> None:
@@ -267,16 +299,13 @@ def main() -> None:
     # Dictionary to store weekly data
     weekly_data = {}
     
-    # Process each week
+    # Process each week (files are too small to be worth worker processes)
     for week_num, filename in csv_files.items():
         print(f"Processing {filename}...")
         
-        # Read data from CSV file
-        data = read_data(filename)
+        daily_summaries = process_week(filename)
         
-        if data:
-            # Calculate daily summaries
-            daily_summaries = calculate_daily_summaries(data)
+        if daily_summaries:
             weekly_data[week_num] = daily_summaries
             print(f"  ✓ Week {week_num}: {len(daily_summaries)} days processed")
         else:
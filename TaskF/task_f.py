@@ -10,41 +10,88 @@
 
 
 
-from datetime import datetime, date
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import NamedTuple
 
 
-def read_data(filename: str) -> list:
+# User date input in dd.mm.yyyy format, surrounding whitespace allowed
+_DATE_RE = re.compile(r"^\s*(\d{1,2})\.(\d{1,2})\.(\d{4})\s*$")
+
+# Report values are rounded to whole hundredths
+_CENT = Decimal("0.01")
+
+# Month names indexed by month number, index 0 is unused
+_MONTH_NAMES = ("", "January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+
+class HourlyData(NamedTuple):
+    """
+    Hourly measurements stored column by column, one entry per hour.
+    Values are integer thousandths (Wh and m°C), so sums are exact.
+    """
+    days: list
+    consumption: array
+    production: array
+    temperature: array
+
+
+def read_data(filename: str) -> HourlyData:
     """Reads a CSV file and returns the rows in a suitable structure."""
-    data = []
-    try:
-        with open(filename, "r", encoding="utf-8") as file:
-            # Skip the header row
-            next(file)
-            for line in file:
-                parts = line.strip().split(";")
-                if len(parts) >= 4:
-                    time_str = parts[0].strip()
-                    consumption_str = parts[1].strip().replace(",", ".")
-                    production_str = parts[2].strip().replace(",", ".")
-                    temp_str = parts[3].strip().replace(",", ".")
-                    
-                    try:
-                        time_obj = datetime.fromisoformat(time_str)
-                        consumption = float(consumption_str)
-                        production = float(production_str)
-                        temperature = float(temp_str)
-                        
-                        data.append({
-                            "time": time_obj,
-                            "consumption": consumption,
-                            "production": production,
-                            "temperature": temperature
-                        })
-                    except (ValueError, AttributeError):
-                        continue
-    except FileNotFoundError:
+    data = HourlyData([], array("q"), array("q"), array("q"))
+    if not os.path.exists(filename):
         print(f"Error: File {filename} not found.")
-    
+        return data
+
+    if os.path.getsize(filename) == 0:
+        # An empty file has no rows and cannot be memory-mapped
+        return data
+
+    # Each day prefix and time suffix is parsed only once
+    parsed_days: dict[bytes, date] = {}
+    valid_times: set[bytes] = set()
+
+    # Parse raw bytes line by line; float() accepts them directly
+    with open(filename, "rb") as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Sequential read-ahead hint
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        # Skip the header row
+        mm.readline()
+
+        for line in iter(mm.readline, b""):
+            parts = line.split(b";")
+            if len(parts) < 4:
+                continue
+            try:
+                timestamp = parts[0].strip()
+                day_bytes = timestamp[:10]
+                day = parsed_days.get(day_bytes)
+                if day is None:
+                    day = parsed_days[day_bytes] = date.fromisoformat(day_bytes.decode())
+                if timestamp[10:] not in valid_times:
+                    # Full check once per new suffix
+                    datetime.fromisoformat(timestamp.decode())
+                    valid_times.add(timestamp[10:])
+                # Decimal comma, at most three decimals: store exact thousandths
+                values = array("q", [round(float(field.replace(b",", b".")) * 1000)
+                                     for field in parts[1:4]])
+            except (ValueError, OverflowError):
+                # Malformed, non-finite or too large for the integer columns
+                continue
+            data.days.append(day)
+            data.consumption.append(values[0])
+            data.production.append(values[1])
+            data.temperature.append(values[2])
+
     return data
 
 
@@ -84,39 +131,83 @@ def format_date(d: date) -> str:
     return f"{d.day}.{d.month}.{d.year}"
 
 
-def format_number(value: float) -> str:
-    """Formats a float to two decimals with comma as separator."""
-    return f"{value:.2f}".replace(".", ",")
+def format_number(value: Decimal) -> str:
+    """Formats a value to two decimals (halves away from zero) with comma as separator."""
+    # Rounds the exact value; a float would round its binary approximation
+    return f"{value.quantize(_CENT, rounding=ROUND_HALF_UP):f}".replace(".", ",")
 
 
 def parse_date_input(date_str: str) -> date:
     """Parses a date string in dd.mm.yyyy format and returns a date object."""
-    parts = date_str.strip().split(".")
-    if len(parts) != 3:
+    match = _DATE_RE.match(date_str)
+    if not match:
         raise ValueError("Invalid date format")
-    day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
-    return date(year, month, day)
+    return date(int(match[3]), int(match[2]), int(match[1]))
+
+
+def aggregate_daily(data: HourlyData) -> dict:
+    """
+    Groups hourly records by day in a single pass.
+    Returns {date: [consumption, production, temperature sum, hour count]},
+    with the sums in integer thousandths like the HourlyData columns.
+    """
+    daily: dict[date, list] = {}
+    days = data.days
+
+    # Each day is a run of consecutive rows
+    starts = [row for row in range(len(days)) if row == 0 or days[row] != days[row - 1]]
+    ends = starts[1:] + [len(days)]
+
+    for start, end in zip(starts, ends):
+        totals = daily.get(days[start])
+        if totals is None:
+            totals = daily[days[start]] = [0, 0, 0, 0]
+        totals[0] += sum(data.consumption[start:end])
+        totals[1] += sum(data.production[start:end])
+        totals[2] += sum(data.temperature[start:end])
+        totals[3] += end - start
+    return daily
 
 
-def get_daily_data(data: list, day: date) -> list:
-    """Returns all hourly records for a specific day."""
-    daily = []
-    for record in data:
-        if record["time"].date() == day:
-            daily.append(record)
-    return daily
+def summarize_days(daily: dict, days: list) -> tuple[Decimal, Decimal, Decimal]:
+    """Returns total consumption, total production and average temperature for the given days."""
+    # Integer sums are exact, so the totals do not depend on how the days are grouped
+    total_consumption = 0
+    total_production = 0
+    temperature_sum = 0
+    hours = 0
+    for day in days:
+        consumption, production, temperature, count = daily[day]
+        total_consumption += consumption
+        total_production += production
+        temperature_sum += temperature
+        hours += count
+
+    # The average is weighted by the number of hourly records per day
+    avg_temperature = Decimal(temperature_sum) / (hours * 1000) if hours else Decimal(0)
+    return (Decimal(total_consumption).scaleb(-3),
+            Decimal(total_production).scaleb(-3),
+            avg_temperature)
 
 
-def get_monthly_data(data: list, month: int, year: int) -> list:
-    """Returns all hourly records for a specific month and year."""
-    monthly = []
-    for record in data:
-        if record["time"].month == month and record["time"].year == year:
-            monthly.append(record)
-    return monthly
+def build_day_index(daily: dict) -> list:
+    """Returns the days with data as a sorted list for binary search lookups."""
+    return sorted(daily)
 
 
-def create_daily_report(data: list) -> list[str]:
+def get_range_days(day_index: list, start_date: date, end_date: date) -> list:
+    """Returns the days with data between start_date and end_date (inclusive)."""
+    return day_index[bisect_left(day_index, start_date):bisect_right(day_index, end_date)]
+
+
+def get_monthly_days(day_index: list, month: int, year: int) -> list:
+    """Returns the days with data in a specific month and year."""
+    first_day = date(year, month, 1)
+    next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return day_index[bisect_left(day_index, first_day):bisect_left(day_index, next_month)]
+
+
+def create_daily_report(daily: dict, day_index: list) -> list[str]:
     """Builds a daily report for a selected date range."""
     lines = []
     
@@ -136,21 +227,9 @@ def create_daily_report(data: list) -> list[str]:
         except (ValueError, IndexError):
             print("Invalid date format. Please use dd.mm.yyyy")
     
-    # Filter data for the date range
-    range_data = []
-    for record in data:
-        rec_date = record["time"].date()
-        if start_date <= rec_date <= end_date:
-            range_data.append(record)
-    
-    # Calculate totals and average
-    total_consumption = sum(r["consumption"] for r in range_data)
-    total_production = sum(r["production"] for r in range_data)
-    
-    if range_data:
-        avg_temperature = sum(r["temperature"] for r in range_data) / len(range_data)
-    else:
-        avg_temperature = 0.0
+    # Calculate totals and average for the date range
+    range_days = get_range_days(day_index, start_date, end_date)
+    total_consumption, total_production, avg_temperature = summarize_days(daily, range_days)
     
     # Build report lines
     lines.append("-" * 53)
@@ -163,7 +242,7 @@ def create_daily_report(data: list) -> list[str]:
     return lines
 
 
-def create_monthly_report(data: list) -> list[str]:
+def create_monthly_report(daily: dict, day_index: list) -> list[str]:
     """Builds a monthly summary report for a selected month."""
     lines = []
     
@@ -179,21 +258,11 @@ def create_monthly_report(data: list) -> list[str]:
             print("Invalid input. Please enter a number between 1 and 12.")
     
     # Get month name
-    month_names = ["", "January", "February", "March", "April", "May", "June",
-                   "July", "August", "September", "October", "November", "December"]
-    month_name = month_names[month]
-    
-    # Filter data for the month
-    monthly_data = get_monthly_data(data, month, 2025)
-    
-    # Calculate totals and average
-    total_consumption = sum(r["consumption"] for r in monthly_data)
-    total_production = sum(r["production"] for r in monthly_data)
+    month_name = _MONTH_NAMES[month]
     
-    if monthly_data:
-        avg_temperature = sum(r["temperature"] for r in monthly_data) / len(monthly_data)
-    else:
-        avg_temperature = 0.0
+    # Calculate totals and average for the month
+    monthly_days = get_monthly_days(day_index, month, 2025)
+    total_consumption, total_production, avg_temperature = summarize_days(daily, monthly_days)
     
     # Build report lines
     lines.append("-" * 53)
@@ -206,18 +275,12 @@ def create_monthly_report(data: list) -> list[str]:
     return lines
 
 
-def create_yearly_report(data: list) -> list[str]:
+def create_yearly_report(daily: dict) -> list[str]:
     """Builds a full-year summary report."""
     lines = []
     
     # Calculate totals and average
-    total_consumption = sum(r["consumption"] for r in data)
-    total_production = sum(r["production"] for r in data)
-    
-    if data:
-        avg_temperature = sum(r["temperature"] for r in data) / len(data)
-    else:
-        avg_temperature = 0.0
+    total_consumption, total_production, avg_temperature = summarize_days(daily, list(daily))
     
     # Build report lines
     lines.append("-" * 53)
@@ -251,19 +314,23 @@ def main() -> None:
     """Main function: reads data, shows menus, and controls report generation."""
     db = read_data("2025.csv")
     
-    if not db:
+    if not db.days:
         print("Error: Could not load data from 2025.csv")
         return
     
+    # Daily totals are computed once and shared by every report
+    daily = aggregate_daily(db)
+    day_index = build_day_index(daily)
+    
     while True:
         choice = show_main_menu()
         
         if choice == "1":
-            report = create_daily_report(db)
+            report = create_daily_report(daily, day_index)
         elif choice == "2":
-            report = create_monthly_report(db)
+            report = create_monthly_report(daily, day_index)
         elif choice == "3":
-            report = create_yearly_report(db)
+            report = create_yearly_report(daily)
         elif choice == "4":
             print("Thank you! Bye!")
             break
@@ -11,15 +11,47 @@ Task G: Class-based implementation
 Refactoring from list-based to object-based data structure
 """
 
-from datetime import datetime
+import mmap
+import os
+import sys
+from datetime import date, datetime, time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def parse_date(value: bytes) -> date:
+    """Parse a YYYY-MM-DD date; repeated dates are parsed only once"""
+    return date.fromisoformat(value.decode())
+
+
+@lru_cache(maxsize=None)
+def parse_time(value: bytes) -> time:
+    """Parse an HH:MM time; repeated times are parsed only once"""
+    return time.fromisoformat(value.decode())
+
+
+@lru_cache(maxsize=None)
+def format_date(value: date) -> str:
+    """Format a date as DD.MM.YYYY; repeated dates are formatted only once"""
+    return f"{value.day:02d}.{value.month:02d}.{value.year}"
+
+
+@lru_cache(maxsize=None)
+def format_time(value: time) -> str:
+    """Format a time as HH.MM; repeated times are formatted only once"""
+    return f"{value.hour:02d}.{value.minute:02d}"
 
 
 class Reservation:
     """Represents a single reservation"""
 
+    # Fields live in fixed slots instead of a per-instance __dict__
+    __slots__ = ("reservation_id", "name", "email", "phone", "date", "time",
+                 "duration", "price", "confirmed", "resource", "created")
+
     def __init__(self, reservation_id: int, name: str, email: str, phone: str,
-                 date, time, duration: int, price: float,
-                 confirmed: bool, resource: str, created):
+                 date: date, time: time, duration: int, price: float,
+                 confirmed: bool, resource: str, created: datetime) -> None:
         self.reservation_id = reservation_id
         self.name = name
         self.email = email
@@ -45,28 +77,29 @@ class Reservation:
         return self.duration * self.price
 
 
-def convert_reservation(data: list[str]) -> Reservation:
+def convert_reservation(data: list[bytes]) -> Reservation:
     """
     Convert reservation data from list to Reservation object
 
     Parameters:
-     data (list[str]): Raw reservation data fields
+     data (list[bytes]): Raw reservation data fields
 
     Returns:
      Reservation: Reservation object with proper types
     """
+    # Only a few resources exist, so every row shares one interned string per resource
     return Reservation(
         reservation_id=int(data[0]),
-        name=data[1],
-        email=data[2],
-        phone=data[3],
-        date=datetime.strptime(data[4], "%Y-%m-%d").date(),
-        time=datetime.strptime(data[5], "%H:%M").time(),
+        name=data[1].decode(),
+        email=data[2].decode(),
+        phone=data[3].decode(),
+        date=parse_date(data[4]),
+        time=parse_time(data[5]),
         duration=int(data[6]),
         price=float(data[7]),
-        confirmed=True if data[8].strip() == 'True' else False,
-        resource=data[9],
-        created=datetime.strptime(data[10].strip(), "%Y-%m-%d %H:%M:%S"),
+        confirmed=data[8] == b'True',
+        resource=sys.intern(data[9].decode()),
+        created=datetime.fromisoformat(data[10].strip().decode()),
     )
 
 
@@ -81,61 +114,94 @@ def fetch_reservations(reservation_file: str) -> list[Reservation]:
      list[Reservation]: List of Reservation objects (no header row)
     """
     reservations: list[Reservation] = []
-    with open(reservation_file, "r", encoding="utf-8") as f:
-        for line in f:
+    if os.path.getsize(reservation_file) == 0:
+        # An empty file has no rows and cannot be memory-mapped
+        return reservations
+
+    # Map the file and split raw bytes; only text fields are decoded
+    with open(reservation_file, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b""):
             if line.strip():
-                fields = line.split("|")
+                fields = line.split(b"|")
                 reservations.append(convert_reservation(fields))
     return reservations
 
 
-def confirmed_reservations(reservations: list[Reservation]) -> None:
-    """Print confirmed reservations"""
+def split_reservations(reservations: list[Reservation]) -> tuple[list[Reservation], list[Reservation]]:
+    """
+    Split reservations into confirmed and long (3+ hours) ones in a single pass
+
+    Parameters:
+     reservations (list[Reservation]): All reservations
+
+    Returns:
+     tuple[list[Reservation], list[Reservation]]: Confirmed reservations and long reservations
+    """
+    confirmed: list[Reservation] = []
+    long: list[Reservation] = []
     for reservation in reservations:
         if reservation.is_confirmed():
-            print(f'- {reservation.name}, {reservation.resource}, {reservation.date.strftime("%d.%m.%Y")} at {reservation.time.strftime("%H.%M")}')
+            confirmed.append(reservation)
+        if reservation.is_long():
+            long.append(reservation)
+    return confirmed, long
 
 
-def long_reservations(reservations: list[Reservation]) -> None:
+def confirmed_reservations(confirmed: list[Reservation]) -> None:
+    """Print confirmed reservations"""
+    lines = [
+        f'- {reservation.name}, {reservation.resource}, {format_date(reservation.date)} at {format_time(reservation.time)}\n'
+        for reservation in confirmed
+    ]
+    sys.stdout.write(''.join(lines))
+
+
+def long_reservations(long: list[Reservation]) -> None:
     """Print long reservations (3+ hours)"""
-    for reservation in reservations:
-        if reservation.is_long():
-            print(f'- {reservation.name}, {reservation.date.strftime("%d.%m.%Y")} at {reservation.time.strftime("%H.%M")}, duration {reservation.duration} h, {reservation.resource}')
+    lines = [
+        f'- {reservation.name}, {format_date(reservation.date)} at {format_time(reservation.time)}, duration {reservation.duration} h, {reservation.resource}\n'
+        for reservation in long
+    ]
+    sys.stdout.write(''.join(lines))
 
 
 def confirmation_statuses(reservations: list[Reservation]) -> None:
     """Print confirmation status for each reservation"""
+    lines = []
     for reservation in reservations:
         status = "Confirmed" if reservation.is_confirmed() else "NOT Confirmed"
-        print(f'{reservation.name} → {status}')
+        lines.append(f'{reservation.name} → {status}\n')
+    sys.stdout.write(''.join(lines))
 
 
-def confirmation_summary(reservations: list[Reservation]) -> None:
+def confirmation_summary(reservations: list[Reservation], confirmed: list[Reservation]) -> None:
     """Print summary of confirmed vs not confirmed"""
-    confirmed_count = sum(1 for r in reservations if r.is_confirmed())
+    confirmed_count = len(confirmed)
     not_confirmed_count = len(reservations) - confirmed_count
     print(f'- Confirmed reservations: {confirmed_count} pcs\n- Not confirmed reservations: {not_confirmed_count} pcs')
 
 
-def total_revenue(reservations: list[Reservation]) -> None:
+def total_revenue(confirmed: list[Reservation]) -> None:
     """Print total revenue from confirmed reservations"""
-    revenue = sum(r.total_price() for r in reservations if r.is_confirmed())
+    revenue = sum(r.total_price() for r in confirmed)
     print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
 
 
 def main() -> None:
     """Main program"""
     reservations = fetch_reservations("reservations.txt")
+    confirmed, long = split_reservations(reservations)
     print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
+    confirmed_reservations(confirmed)
     print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
+    long_reservations(long)
     print("3) Reservation Confirmation Status")
     confirmation_statuses(reservations)
     print("4) Confirmation Summary")
-    confirmation_summary(reservations)
+    confirmation_summary(reservations, confirmed)
     print("5) Total Revenue from Confirmed Reservations")
-    total_revenue(reservations)
+    total_revenue(confirmed)
 
 
 if __name__ == "__main__":